@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ImageIO mérése szimulált hálózati késleltetéssel (LatencyFS), 1 és N szállal.
+# Használat: python3 bench_image_io.py [--files 40] [--delay 0.02] [--workers 8]
+
+import argparse, tempfile, time
+from pathlib import Path
+
+from image_io import ImageIO, LatencyFS
+
+def run(img_dir: Path, delay: float, workers: int) -> float:
+    start = time.perf_counter()
+    with ImageIO(img_dir, fs=LatencyFS(delay), workers=workers) as images:
+        images.stat_many()
+        for _ in images.iter_read(images.names()):
+            pass
+    return time.perf_counter() - start
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description='ImageIO mérése szimulált késleltetéssel')
+    ap.add_argument('--files', type=int, default=40)
+    ap.add_argument('--delay', type=float, default=0.02, help='késleltetés hívásonként (mp)')
+    ap.add_argument('--workers', type=int, default=8)
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        img_dir = Path(tmp)
+        for k in range(args.files):
+            (img_dir / f'{k:03d}_kep.jpg').write_bytes(b'\0' * 64 * 1024)
+        serial = run(img_dir, args.delay, 1)
+        parallel = run(img_dir, args.delay, args.workers)
+    print(f'{args.files} fájl, {args.delay * 1000:.0f} ms/hívás: '
+          f'1 szál {serial:.2f} s, {args.workers} szál {parallel:.2f} s ({serial / parallel:.1f}x)')
+
+if __name__ == "__main__":
+    main()
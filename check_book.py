@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Gyors előellenőrzés renderelés nélkül: jelölők, elárvult szöveg, képek, címek.
+# Használat: python3 check_book.py [text.txt] [--images images] [--strict]
+# Kimenet: "fájl:sor: HIBA|FIGYELEM: üzenet" — szerkesztők és CI is értelmezi.
+
+import argparse, re, sys, time
+from pathlib import Path
+
+from image_io import ImageIO
+from image_registry import default_registry
+from make_book import _COVER_STEMS, _image_candidates, _match_author_images
+
+def check_text(text: str, img_dir: Path, overrides: dict[str, str | None] | None = None) -> list[tuple[int, str, str]]:
+    issues = []
+    def err(n, msg): issues.append((n, 'HIBA', msg))
+    def warn(n, msg): issues.append((n, 'FIGYELEM', msg))
+
+    current_section = None  # 'preface' | 'story'
+    section_line = 0
+    preface_seen = 0
+    titles = {}
+    story_authors = []  # (sor, szerző) — ezek kapnak képoldalt
+
+    for n, raw in enumerate(text.replace('\r\n','\n').replace('\r','\n').split('\n'), 1):
+        line = raw.strip()
+        if not line:
+            continue
+
+        if line.startswith('['):
+            if line == '[ELŐSZÓ]':
+                if preface_seen:
+                    warn(n, f'ismételt [ELŐSZÓ] (első: {preface_seen}. sor)')
+                else:
+                    preface_seen = n
+                if current_section:
+                    err(section_line, 'a blokk [SZERZŐ:] nélkül maradt, a következő [ELŐSZÓ] zárja')
+                current_section, section_line = 'preface', n
+                continue
+
+            if line.startswith('[SZERZŐ_TEMP:'):
+                if not line.endswith(']'):
+                    err(n, 'hiányzó záró "]" a [SZERZŐ_TEMP:] sorban')
+                continue
+
+            for marker in ('[CÍM:', '[SZERZŐ:'):
+                if line.startswith(marker):
+                    break
+            else:
+                # a generátor a nem jelölő alakú "[...]" sorokat sima bekezdésként kiírja
+                if re.match(r'^\[[A-ZÁÉÍÓÖŐÚÜŰ_]+[:\]]', line):
+                    err(n, f'ismeretlen jelölő: {line[:40]}')
+                else:
+                    warn(n, f'"[" kezdetű sor, bekezdésként jelenik meg: {line[:40]}')
+                if not current_section:
+                    err(n, 'szöveg blokkon kívül — kimarad a kimenetből')
+                continue
+
+            if not line.endswith(']'):
+                err(n, f'hiányzó záró "]" a {marker} sorban (az utolsó karakter levágódna)')
+                value = line[len(marker):].strip()
+            else:
+                value = line[len(marker):-1].strip()
+            if not value:
+                err(n, f'üres {marker}] érték')
+
+            if marker == '[CÍM:':
+                if current_section == 'preface':
+                    warn(section_line, 'az előszó [SZERZŐ:] nélkül zárul')
+                if value in titles:
+                    warn(n, f'ismételt cím: "{value}" (első: {titles[value]}. sor)')
+                else:
+                    titles[value] = n
+                if current_section != 'story':
+                    current_section, section_line = 'story', n
+            else:
+                if not current_section:
+                    warn(n, f'[SZERZŐ: {value}] nyitott blokk nélkül — kimarad a kimenetből')
+                elif current_section == 'story' and value:
+                    story_authors.append((n, value))
+                current_section = None
+            continue
+
+        if not current_section:
+            err(n, 'szöveg blokkon kívül — kimarad a kimenetből')
+
+    if current_section:
+        err(section_line, 'lezáratlan blokk: nincs [SZERZŐ:] a fájl végéig')
+
+    # --- képek ---
+    if not img_dir.is_dir():
+        warn(0, f'nincs {img_dir}/ mappa — minden kép helyőrző lesz')
+        return issues
+    images = ImageIO(img_dir)
+    for stem in sorted(_COVER_STEMS):
+        if not images.exists(f'{stem}.jpg'):
+            warn(0, f'hiányzó borítókép: {img_dir}/{stem}.jpg')
+    cands = _image_candidates(images.names())
+    overrides = overrides or {}
+    for n, author in story_authors:
+        if author in overrides:
+            if overrides[author] is not None and not images.exists(overrides[author]):
+                warn(n, f'a kézi felülírás nem létező képre mutat: "{author}" -> {overrides[author]}')
+            continue
+        hits = _match_author_images(author, cands)
+        if not hits:
+            warn(n, f'nincs kép ehhez: "{author}" — helyőrző lesz')
+        elif len(hits) > 1:
+            warn(n, f'kétértelmű kép "{author}": {", ".join(hits)} (az elsőt használjuk)')
+
+    return issues
+
+def main(argv=None) -> int:
+    here = Path(__file__).parent
+    ap = argparse.ArgumentParser(description='text.txt és images/ előellenőrzése renderelés nélkül')
+    ap.add_argument('text', nargs='?', default=here / 'text.txt', type=Path)
+    ap.add_argument('--images', default=None, type=Path, help='képmappa (alap: a text.txt melletti images/)')
+    ap.add_argument('--strict', action='store_true', help='a figyelmeztetések is hibát jelentenek')
+    args = ap.parse_args(argv)
+
+    start = time.perf_counter()
+    if not args.text.exists():
+        print(f"HIBA: {args.text} nem található!"); return 2
+    img_dir = args.images if args.images is not None else args.text.parent / 'images'
+    overrides = default_registry(args.text.parent).data['overrides']
+    issues = check_text(args.text.read_text('utf-8'), img_dir, overrides)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    for n, level, msg in sorted(issues):
+        print(f'{args.text}:{n}: {level}: {msg}' if n else f'{args.text}: {level}: {msg}')
+    errors = sum(1 for _, level, _ in issues if level == 'HIBA')
+    warnings = len(issues) - errors
+    print(f'{errors} hiba, {warnings} figyelmeztetés ({elapsed:.1f} ms)', file=sys.stderr)
+    return 1 if errors or (args.strict and warnings) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
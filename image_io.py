@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Képmappa I/O hálózati megosztásokhoz (SMB/NFS): a mappát egyszer listázzuk,
+# a stat- és olvasási hívások szálkészletben, korlátozott párhuzamossággal futnak.
+
+import os, time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+class LocalFS:
+    def listdir(self, path: Path) -> list[str]:
+        with os.scandir(path) as it:
+            return [e.name for e in it if e.is_file()]
+
+    def stat(self, path: Path) -> os.stat_result:
+        return os.stat(path)
+
+    def read(self, path: Path) -> bytes:
+        return Path(path).read_bytes()
+
+class LatencyFS(LocalFS):
+    # tesztekhez: minden hívás `delay` másodperc körbefordulást szimulál
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+
+    def listdir(self, path):
+        time.sleep(self.delay); return super().listdir(path)
+
+    def stat(self, path):
+        time.sleep(self.delay); return super().stat(path)
+
+    def read(self, path):
+        time.sleep(self.delay); return super().read(path)
+
+class ImageIO:
+    def __init__(self, img_dir: Path = Path('images'), fs: LocalFS | None = None, workers: int = 8):
+        self.img_dir = Path(img_dir)
+        self.fs = fs or LocalFS()
+        self.workers = workers
+        self._names: list[str] | None = None
+        self._name_set: set[str] = set()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='image-io')
+        return self._pool
+
+    def names(self) -> list[str]:
+        if self._names is None:
+            try:
+                self._names = sorted(self.fs.listdir(self.img_dir))
+            except FileNotFoundError:
+                self._names = []
+            self._name_set = set(self._names)
+        return self._names
+
+    def exists(self, name: str) -> bool:
+        self.names()
+        return name in self._name_set
+
+    def stat_many(self, names=None) -> dict[str, os.stat_result]:
+        names = self.names() if names is None else [n for n in names if self.exists(n)]
+        pool = self._executor()
+        futures = {n: pool.submit(self.fs.stat, self.img_dir / n) for n in names}
+        return {n: f.result() for n, f in futures.items()}
+
+    def read(self, name: str) -> bytes:
+        if not self.exists(name):
+            raise FileNotFoundError(self.img_dir / name)
+        return self.fs.read(self.img_dir / name)
+
+    def iter_read(self, names):
+        # (név, bájtok) párok beérkezési sorrendben; egyszerre legfeljebb 2×workers olvasás
+        # van úton, így a memóriában sem tartjuk a teljes mappát
+        pending = deque(n for n in names if self.exists(n))
+        pool = self._executor()
+        inflight: dict[Future, str] = {}
+        while pending or inflight:
+            while pending and len(inflight) < 2 * self.workers:
+                n = pending.popleft()
+                inflight[pool.submit(self.fs.read, self.img_dir / n)] = n
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for f in done:
+                yield inflight.pop(f), f.result()
+
+    def read_many(self, names) -> dict[str, bytes]:
+        return dict(self.iter_read(names))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Futások között megőrzött szerző → kép összerendelés.
+# A fájl egy sorozat összes kötetéé lehet (BOOK_IMAGE_REGISTRY), képmappánként
+# tárolja a mappa ujjlenyomatát (név → [méret, mtime_ns]) és a feloldott képeket.
+# Kézi felülírás a "overrides" kulcs alatt: {"Szerző Neve": "fajlnev.jpg"};
+# null érték = szándékosan nincs kép (helyőrző). A fájl gépfüggő gyorsítótár,
+# nem verziózzuk (.gitignore) — sorozatnál közös útvonalra érdemes tenni.
+
+import json, os, tempfile
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # nem POSIX rendszeren zár nélkül írunk
+    fcntl = None
+
+from image_io import ImageIO
+
+class AuthorImageRegistry:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.data = self._load()
+        self._dirty: dict[str, dict] = {}
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text('utf-8'))
+        except (FileNotFoundError, ValueError):
+            data = {}
+        data.setdefault('overrides', {})
+        data.setdefault('dirs', {})
+        return data
+
+    def resolve(self, images: ImageIO, authors, match) -> dict[str, str | None]:
+        # match(szerzők, fájlnevek) -> {szerző: kép | None}
+        key = str(images.img_dir.resolve())
+        names = images.names()
+        files = {n: [st.st_size, st.st_mtime_ns] for n, st in images.stat_many(names).items()}
+        entry = self.data['dirs'].get(key, {})
+        old_files = entry.get('files', {})
+        cached = dict(entry.get('authors', {}))
+
+        if old_files != files:
+            added = [n for n in names if n not in old_files]
+            removed = {n for n in old_files if n not in files}
+            # csak azokat oldjuk fel újra, akiket a hozzáadott/törölt fájlok érinthetnek
+            hit_by_added = match(list(cached), added) if added else {}
+            for author, img in list(cached.items()):
+                if img in removed or hit_by_added.get(author):
+                    del cached[author]
+
+        overrides = self.data['overrides']
+        todo = [a for a in dict.fromkeys(authors) if a not in cached and a not in overrides]
+        if todo:
+            cached.update(match(todo, names))
+
+        result = {}
+        for author in authors:
+            if author not in overrides:
+                result[author] = cached[author]
+                continue
+            img = overrides[author]
+            if img is not None and not images.exists(img):
+                print(f"FIGYELEM: a kézi felülírás nem létező képre mutat: {author} -> {img}")
+                img = match([author], names)[author]
+            result[author] = img
+
+        new_entry = {'files': files, 'authors': cached}
+        if new_entry != entry:
+            self.data['dirs'][key] = new_entry
+            self._dirty[key] = new_entry
+        return result
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        # más kötet közben írhatta: zár alatt friss állapotra fésüljük rá a saját mappáinkat
+        with open(self.path.with_name(self.path.name + '.lock'), 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            data = self._load()
+            data['dirs'].update(self._dirty)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.path.parent,
+                                             prefix=self.path.name + '.', suffix='.tmp',
+                                             delete=False) as tmp:
+                tmp.write(json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + '\n')
+            try:
+                os.replace(tmp.name, self.path)
+            except OSError:
+                os.unlink(tmp.name)
+                raise
+        self.data = data
+        self._dirty = {}
+
+def default_registry(base: Path = Path('.')) -> AuthorImageRegistry:
+    return AuthorImageRegistry(Path(base) / os.environ.get('BOOK_IMAGE_REGISTRY', 'author_images.json'))
@@ -1,47 +1,28 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import os, re, unicodedata
+import os
 from pathlib import Path
 
-def _slugify_image_name(value: str) -> str:
-    normalized = unicodedata.normalize('NFKD', value)
-    without_accents = ''.join(ch for ch in normalized if not unicodedata.combining(ch))
-    cleaned = re.sub(r'_+', '_', (
-        without_accents.lower()
-        .replace(' ', '_').replace('.', '').replace('-', '_')
-    )).strip('_')
-    return cleaned
-
-def _strip_numeric_prefix(slug: str) -> str:
-    return re.sub(r'^\d+_+', '', slug)
-
-def _find_author_image(author: str) -> str | None:
-    img_dir = Path('images')
-    if not img_dir.exists():
-        return None
-    skip = {'000_elso_borito','001_elso_borito_belso','998_hatso_borito_belso','999_hatso_borito'}
-    exts = {'.jpg','.jpeg','.png','.webp','.gif'}
-    a = _slugify_image_name(author)
-    cands = []
-    for p in sorted(img_dir.iterdir()):
-        if p.is_file() and p.suffix.lower() in exts and p.stem not in skip:
-            s = _slugify_image_name(p.stem)
-            cands.append((p.name, s, _strip_numeric_prefix(s)))
-    for n,_,np in cands:
-        if np == a: return n
-    for n,s,np in cands:
-        if a in s or a in np: return n
-    at = [t for t in a.split('_') if t]
-    for n,_,np in cands:
-        if all(t in set(np.split('_')) for t in at if len(t)>1): return n
-    return None
+from image_io import ImageIO
+from image_registry import default_registry
+from make_book import _find_author_image, _resolve_book_images
+from stylesheet import minimal_stylesheet
 
 def create_book_html():
     os.chdir(Path(__file__).parent)
     if not Path('text.txt').exists():
         print("❌ HIBA: text.txt nem található!"); return
 
+    content = Path('text.txt').read_text('utf-8').replace('\r\n','\n').replace('\r','\n')
+    with ImageIO(Path('images')) as images:
+        author_images = _resolve_book_images(images, content, default_registry())
+        html = minimal_stylesheet(_render_book_html(content, images, author_images))
+
+    Path('book.html').write_text(html, encoding='utf-8')
+    print("✅ KÉSZ: book.html – nyomtatásnál állítsd: Margók=Nincs, Méretezés=100%, Háttérgrafika=on.")
+
+def _render_book_html(content: str, images: ImageIO, author_images: dict[str, str | None]) -> str:
     html = '''<!DOCTYPE html>
 <html lang="hu">
 <head>
@@ -220,18 +201,6 @@ class PositionFixHandler extends Paged.Handler {
       page.style.transform = 'none';
     });
 
-    const customCSS = `
-      .pagedjs_pages { margin: 0 !important; padding: 0 !important; transform: none !important; }
-      .pagedjs_page { margin: 0 !important; transform: none !important; position: static !important; }
-      .pagedjs_pagebox { margin: 0 !important; padding: 0 !important; transform: none !important; }
-      .pagedjs_page_content { transform: none !important; position: relative !important; }
-    `;
-    
-    const style = document.createElement('style');
-    style.type = 'text/css';
-    style.innerHTML = customCSS;
-    document.head.appendChild(style);
-    
     console.log('✅ Pozíció javítás befejezve - elcsúszás megszüntetve');
   }
 }
@@ -253,7 +222,7 @@ document.addEventListener('DOMContentLoaded', function() {
 <div class="page cover-page">
 '''
     html += ('            <img src="images/000_elso_borito.jpg" alt="Borító">\n'
-             if Path('images/000_elso_borito.jpg').exists()
+             if images.exists('000_elso_borito.jpg')
              else '            <div class="page-content"><div class="image-placeholder">[Első borító]</div></div>\n')
     html += '        </div>\n'
 
@@ -263,7 +232,7 @@ document.addEventListener('DOMContentLoaded', function() {
 <div class="page cover-page">
 '''
     html += ('            <img src="images/001_elso_borito_belso.jpg" alt="Belső borító">\n'
-             if Path('images/001_elso_borito_belso.jpg').exists()
+             if images.exists('001_elso_borito_belso.jpg')
              else '            <div class="page-content"><div class="image-placeholder">[Első borító belső oldala]</div></div>\n')
     html += '        </div>\n'
 
@@ -299,8 +268,6 @@ document.addEventListener('DOMContentLoaded', function() {
 '''
 
     # --- Szöveg feldolgozás ---
-    content = Path('text.txt').read_text('utf-8').replace('\r\n','\n').replace('\r','\n')
-
     content_html = ''
     toc_entries  = []
     page_num = 1  # az ELŐSZÓ oldala lesz 1
@@ -324,7 +291,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
     def add_author_page(author):
         nonlocal content_html, page_num
-        img = _find_author_image(author)
+        img = author_images[author] if author in author_images else _find_author_image(author, images)
         if img:
             content_html += f'''
 <!-- KÉP: {author} -->
@@ -442,7 +409,7 @@ document.addEventListener('DOMContentLoaded', function() {
 <div class="page cover-page">
 '''
     html += ('  <img src="images/998_hatso_borito_belso.jpg" alt="Hátsó borító belső">\n'
-             if Path('images/998_hatso_borito_belso.jpg').exists()
+             if images.exists('998_hatso_borito_belso.jpg')
              else '  <div class="page-content"><div class="image-placeholder">[Hátsó borító belső oldala]</div></div>\n')
     html += '</div>\n'
 
@@ -452,14 +419,12 @@ document.addEventListener('DOMContentLoaded', function() {
 <div class="page cover-page">
 '''
     html += ('  <img src="images/999_hatso_borito.jpg" alt="Hátsó borító">\n'
-             if Path('images/999_hatso_borito.jpg').exists()
+             if images.exists('999_hatso_borito.jpg')
              else '  <div class="page-content"><div class="image-placeholder">[Hátsó borító]</div></div>\n')
     html += '</div>\n'
 
     html += '</div>\n</body>\n</html>'
-
-    Path('book.html').write_text(html, encoding='utf-8')
-    print("✅ KÉSZ: book.html – nyomtatásnál állítsd: Margók=Nincs, Méretezés=100%, Háttérgrafika=on.")
+    return html
 
 if __name__ == "__main__":
     try:
@@ -4,6 +4,10 @@
 import os, re, unicodedata
 from pathlib import Path
 
+from image_io import ImageIO
+from image_registry import AuthorImageRegistry, default_registry
+from stylesheet import minimal_stylesheet
+
 def _slugify_image_name(value: str) -> str:
     normalized = unicodedata.normalize('NFKD', value)
     without_accents = ''.join(ch for ch in normalized if not unicodedata.combining(ch))
@@ -16,32 +20,66 @@ def _slugify_image_name(value: str) -> str:
 def _strip_numeric_prefix(slug: str) -> str:
     return re.sub(r'^\d+_+', '', slug)
 
-def _find_author_image(author: str) -> str | None:
-    img_dir = Path('images')
-    if not img_dir.exists():
-        return None
-    skip = {'000_elso_borito','001_elso_borito_belso','998_hatso_borito_belso','999_hatso_borito'}
-    exts = {'.jpg','.jpeg','.png','.webp','.gif'}
-    a = _slugify_image_name(author)
+_COVER_STEMS = {'000_elso_borito','001_elso_borito_belso','998_hatso_borito_belso','999_hatso_borito'}
+_IMAGE_EXTS = {'.jpg','.jpeg','.png','.webp','.gif'}
+
+def _image_candidates(names) -> list[tuple[str, str, str]]:
     cands = []
-    for p in sorted(img_dir.iterdir()):
-        if p.is_file() and p.suffix.lower() in exts and p.stem not in skip:
+    for name in names:
+        p = Path(name)
+        if p.suffix.lower() in _IMAGE_EXTS and p.stem not in _COVER_STEMS:
             s = _slugify_image_name(p.stem)
             cands.append((p.name, s, _strip_numeric_prefix(s)))
-    for n,_,np in cands:
-        if np == a: return n
-    for n,s,np in cands:
-        if a in s or a in np: return n
+    return cands
+
+# az első illeszkedő szint összes találata — több elem = kétértelmű név
+def _match_author_images(author: str, cands: list[tuple[str, str, str]]) -> list[str]:
+    a = _slugify_image_name(author)
+    hits = [n for n,_,np in cands if np == a]
+    if hits: return hits
+    hits = [n for n,s,np in cands if a in s or a in np]
+    if hits: return hits
     at = [t for t in a.split('_') if t]
-    for n,_,np in cands:
-        if all(t in set(np.split('_')) for t in at if len(t)>1): return n
-    return None
+    return [n for n,_,np in cands if all(t in set(np.split('_')) for t in at if len(t)>1)]
+
+def _match_authors(authors, names) -> dict[str, str | None]:
+    cands = _image_candidates(names)
+    result = {}
+    for author in authors:
+        hits = _match_author_images(author, cands)
+        result[author] = hits[0] if hits else None
+    return result
+
+def _find_author_image(author: str, images: ImageIO | None = None) -> str | None:
+    return _match_authors([author], (images or ImageIO()).names())[author]
+
+# a szerzők képeit egyetlen listázás alapján, előre feloldjuk — bájtokat nem olvasunk
+def _resolve_book_images(images: ImageIO, content: str,
+                         registry: AuthorImageRegistry | None = None) -> dict[str, str | None]:
+    authors = [m.group(1).strip() for m in re.finditer(r'^\s*\[SZERZŐ:(.*)\]\s*$', content, re.M)]
+    if registry is None or not images.img_dir.is_dir():
+        return _match_authors(authors, images.names())
+    author_images = registry.resolve(images, authors, _match_authors)
+    try:
+        registry.save()
+    except OSError as e:
+        print(f"FIGYELEM: a képnyilvántartás nem menthető ({registry.path}): {e}")
+    return author_images
 
 def create_book_html():
     os.chdir(Path(__file__).parent)
     if not Path('text.txt').exists():
         print("HIBA: text.txt nem található!"); return
 
+    content = Path('text.txt').read_text('utf-8').replace('\r\n','\n').replace('\r','\n')
+    with ImageIO(Path('images')) as images:
+        author_images = _resolve_book_images(images, content, default_registry())
+        html = minimal_stylesheet(_render_book_html(content, images, author_images))
+
+    Path('book.html').write_text(html, encoding='utf-8')
+    print("KESZ: book.html - nyomtatásnál állítsd: Margók=Nincs, Méretezés=100%, Háttérgrafika=on.")
+
+def _render_book_html(content: str, images: ImageIO, author_images: dict[str, str | None]) -> str:
     html = '''<!DOCTYPE html>
 <html lang="hu">
 <head>
@@ -124,7 +162,7 @@ h2 + p,.first-p{text-indent:0}
 <section class="cover-section cover-front">
 '''
     html += ('  <img src="images/000_elso_borito.jpg" alt="Borító">\n'
-             if Path('images/000_elso_borito.jpg').exists()
+             if images.exists('000_elso_borito.jpg')
              else '  <div class="image-placeholder">[Első borító]</div>\n')
     html += '</section>\n'
 
@@ -134,7 +172,7 @@ h2 + p,.first-p{text-indent:0}
 <section class="cover-section cover-inner">
 '''
     html += ('  <img src="images/001_elso_borito_belso.jpg" alt="Belső borító">\n'
-             if Path('images/001_elso_borito_belso.jpg').exists()
+             if images.exists('001_elso_borito_belso.jpg')
              else '  <div class="image-placeholder">[Első borító belső oldala]</div>\n')
     html += '</section>\n'
 
@@ -162,8 +200,6 @@ h2 + p,.first-p{text-indent:0}
 '''
 
     # --- Szöveg feldolgozás ---
-    content = Path('text.txt').read_text('utf-8').replace('\r\n','\n').replace('\r','\n')
-
     content_html = ''
     toc_html = ''  # kompatibilitás: néhány környezet még hozzáfűzné, így legyen üres
     heading_counter = 0
@@ -206,7 +242,7 @@ h2 + p,.first-p{text-indent:0}
 
     def add_author_page(author: str):
         nonlocal content_html
-        img = _find_author_image(author)
+        img = author_images[author] if author in author_images else _find_author_image(author, images)
         if img:
             content_html += f'''
 <!-- KÉP: {author} -->
@@ -302,7 +338,7 @@ h2 + p,.first-p{text-indent:0}
 <section class="cover-section cover-back-inner">
 '''
     html += ('  <img src="images/998_hatso_borito_belso.jpg" alt="Hátsó borító belső">\n'
-             if Path('images/998_hatso_borito_belso.jpg').exists()
+             if images.exists('998_hatso_borito_belso.jpg')
              else '  <div class="image-placeholder">[Hátsó borító belső oldala]</div>\n')
     html += '</section>\n'
 
@@ -312,14 +348,12 @@ h2 + p,.first-p{text-indent:0}
 <section class="cover-section cover-back">
 '''
     html += ('  <img src="images/999_hatso_borito.jpg" alt="Hátsó borító">\n'
-             if Path('images/999_hatso_borito.jpg').exists()
+             if images.exists('999_hatso_borito.jpg')
              else '  <div class="image-placeholder">[Hátsó borító]</div>\n')
     html += '</section>\n'
 
     html += '</main>\n</body>\n</html>'
-
-    Path('book.html').write_text(html, encoding='utf-8')
-    print("KESZ: book.html - nyomtatásnál állítsd: Margók=Nincs, Méretezés=100%, Háttérgrafika=on.")
+    return html
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Képernyős kiadás publikálása: a képek tartalom-hash-es néven kerülnek a dist/assets/
+# mappába (örökre cache-elhetők), a book.html hivatkozásai ezekre mutatnak.
+# Csak a megváltozott fájlokat írjuk ki; a manifest.json a következő futás alapja.
+# Használat: python3 make_book.py && python3 publish_book.py [--out dist]
+
+import argparse, gzip, hashlib, json, os, re, sys
+from pathlib import Path
+
+from image_io import ImageIO
+
+try:
+    import brotli
+except ImportError:  # opcionális: nélküle csak .gz változat készül
+    brotli = None
+
+_COMPRESSIBLE = {'.html', '.css', '.js', '.svg', '.json'}
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+def _precompress(path: Path, data: bytes, hashed: bool = False) -> list[str]:
+    # hash-es névnél a meglévő változat biztosan azonos, nem olvassuk vissza
+    encodings = ['gzip']
+    gz = path.with_name(path.name + '.gz')
+    if not (hashed and gz.exists()):
+        _write_if_changed(gz, gzip.compress(data, 9, mtime=0))
+    if brotli is not None:
+        br = path.with_name(path.name + '.br')
+        if not (hashed and br.exists()):
+            _write_if_changed(br, brotli.compress(data, quality=11))
+        encodings.append('br')
+    return encodings
+
+def _hashed_name(name: str, data: bytes) -> tuple[str, str]:
+    digest = hashlib.sha256(data).hexdigest()
+    p = Path(name)
+    return f'{p.stem}.{digest[:12]}{p.suffix}', digest
+
+def publish(html_path: Path, out_dir: Path, images: ImageIO) -> dict[str, int]:
+    html = html_path.read_text('utf-8')
+    manifest_path = out_dir / 'manifest.json'
+    try:
+        prev = json.loads(manifest_path.read_text('utf-8'))
+    except (FileNotFoundError, ValueError):
+        prev = {}
+    prev_sources = prev.get('sources', {})
+
+    refs = sorted(set(re.findall(r'src="images/([^"]+)"', html)))
+    missing = [n for n in refs if not images.exists(n)]
+    for n in missing:
+        print(f"FIGYELEM: hiányzó kép, a hivatkozás változatlan marad: images/{n}")
+    stats = images.stat_many(n for n in refs if n not in missing)
+
+    sources, todo = {}, []
+    for n, st in stats.items():
+        old = prev_sources.get(n)
+        if (old and old['size'] == st.st_size and old['mtime_ns'] == st.st_mtime_ns
+                and (out_dir / old['asset']).exists()):
+            sources[n] = old
+        else:
+            todo.append(n)
+
+    counts = {'copied': 0, 'unchanged': len(sources)}
+    for n, data in images.iter_read(todo):
+        hashed, digest = _hashed_name(n, data)
+        asset = f'assets/{hashed}'
+        entry = {'asset': asset, 'sha256': digest, 'size': stats[n].st_size, 'mtime_ns': stats[n].st_mtime_ns}
+        # a név a tartalom hash-e: ha már ott van, nem olvassuk vissza és nem írjuk újra
+        if (out_dir / asset).exists():
+            counts['unchanged'] += 1
+        else:
+            _write_if_changed(out_dir / asset, data)
+            counts['copied'] += 1
+        if Path(n).suffix.lower() in _COMPRESSIBLE:
+            entry['encodings'] = _precompress(out_dir / asset, data, hashed=True)
+        sources[n] = entry
+
+    html = re.sub(r'src="images/([^"]+)"',
+                  lambda m: f'src="{sources[m.group(1)]["asset"]}"' if m.group(1) in sources else m.group(0),
+                  html)
+    page = html.encode('utf-8')
+    page_path = out_dir / html_path.name
+    if _write_if_changed(page_path, page):
+        counts['copied'] += 1
+    encodings = _precompress(page_path, page)
+
+    manifest = {
+        'entry': {html_path.name: {'sha256': hashlib.sha256(page).hexdigest(), 'encodings': encodings}},
+        'assets': {f'images/{n}': e['asset'] for n, e in sorted(sources.items())},
+        'sources': dict(sorted(sources.items())),
+    }
+    _write_if_changed(manifest_path, (json.dumps(manifest, ensure_ascii=False, indent=2) + '\n').encode('utf-8'))
+    return counts
+
+def main(argv=None) -> int:
+    here = Path(__file__).parent
+    ap = argparse.ArgumentParser(description='book.html publikálása hash-es, előtömörített eszközökkel')
+    ap.add_argument('--html', default=here / 'book.html', type=Path)
+    ap.add_argument('--images', default=here / 'images', type=Path)
+    ap.add_argument('--out', default=here / 'dist', type=Path)
+    args = ap.parse_args(argv)
+
+    if not args.html.exists():
+        print(f"HIBA: {args.html} nem található! Előbb futtasd a make_book.py-t."); return 2
+    if brotli is None:
+        print("FIGYELEM: a brotli modul nincs telepítve, csak .gz változatok készülnek")
+    with ImageIO(args.images) as images:
+        counts = publish(args.html, args.out, images)
+    print(f"KESZ: {args.out} — {counts['copied']} új/módosult, {counts['unchanged']} változatlan fájl")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
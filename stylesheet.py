@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# A beágyazott <style> blokkot a ténylegesen legenerált dokumentumhoz szabjuk:
+# csak azok a szelektorok maradnak, amelyek osztályai és elemei előfordulnak,
+# az ismétlődő szabályok egyszer szerepelnek. A Paged.js futás közben hozza létre
+# a .pagedjs_* osztályokat, ezért ezeket mindig megtartjuk.
+
+import re
+
+_RUNTIME_CLASS = re.compile(r'^pagedjs_')
+_PSEUDO = re.compile(r'::?[\w-]+(\([^)]*\))?')
+
+def _blocks(css: str):
+    # (előtag, blokk tartalma) párok a legfelső szinten, kapcsos zárójelek egyeztetésével
+    i = 0
+    while True:
+        start = css.find('{', i)
+        if start < 0:
+            return
+        depth, j = 1, start + 1
+        while depth and j < len(css):
+            depth += {'{': 1, '}': -1}.get(css[j], 0)
+            j += 1
+        yield css[i:start].strip(), css[start + 1:j - 1].strip()
+        i = j
+
+def _split_selectors(prelude: str) -> list[str]:
+    parts, depth, cur = [], 0, ''
+    for ch in prelude:
+        depth += {'(': 1, ')': -1}.get(ch, 0)
+        if ch == ',' and not depth:
+            parts.append(cur.strip()); cur = ''
+        else:
+            cur += ch
+    parts.append(cur.strip())
+    return [p for p in parts if p]
+
+def _selector_used(selector: str, classes: set[str], tags: set[str]) -> bool:
+    bare = _PSEUDO.sub('', selector)
+    for cls in re.findall(r'\.([\w-]+)', bare):
+        if cls not in classes and not _RUNTIME_CLASS.match(cls):
+            return False
+    for compound in re.split(r'[\s>+~]+', bare):
+        m = re.match(r'[a-zA-Z][a-zA-Z0-9]*', compound)
+        if m and m.group(0).lower() not in tags:
+            return False
+    return True
+
+def _prune(css: str, classes: set[str], tags: set[str], seen: set[str]) -> list[str]:
+    rules = []
+    for prelude, body in _blocks(css):
+        if prelude.startswith('@media'):
+            inner = _prune(body, classes, tags, set())
+            rule = f'{prelude}{{\n  ' + '\n  '.join(inner) + '\n}' if inner else ''
+        elif prelude.startswith('@'):
+            rule = f'{prelude}{{{body}}}'
+        else:
+            selectors = [' '.join(s.split()) for s in _split_selectors(prelude) if _selector_used(s, classes, tags)]
+            body = re.sub(r'\s*\n\s*', ' ', body).strip()
+            rule = f'{",".join(selectors)}{{{body}}}' if selectors else ''
+        if rule and rule not in seen:
+            seen.add(rule)
+            rules.append(rule)
+    return rules
+
+def minimal_stylesheet(html: str) -> str:
+    m = re.search(r'<style>(.*?)</style>', html, re.S)
+    if not m:
+        return html
+    classes = {c for attr in re.findall(r'class="([^"]*)"', html) for c in attr.split()}
+    tags = {t.lower() for t in re.findall(r'<([a-zA-Z][a-zA-Z0-9]*)', html)}
+    css = re.sub(r'/\*.*?\*/', '', m.group(1), flags=re.S)
+    rules = _prune(css, classes, tags, set())
+    return html[:m.start(1)] + '\n' + '\n'.join(rules) + '\n' + html[m.end(1):]